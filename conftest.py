@@ -0,0 +1,11 @@
+"""
+Pytest configuration shared by the test modules.
+"""
+
+import os
+import tempfile
+
+# Point the app at a throwaway database before main is imported
+os.environ["DATABASE_URL"] = "sqlite+aiosqlite:///" + os.path.join(
+    tempfile.mkdtemp(), "test.db"
+)
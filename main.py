@@ -2,33 +2,152 @@
 Main module for the FastAPI application that handles SOS alerts and reminders.
 """
 
-from typing import List
+import asyncio
+import logging
+import os
+import queue
+import random
+import re
+import time
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
 from datetime import datetime, timedelta
 
-import requests
-from fastapi import FastAPI, Depends
-from pydantic import BaseModel, Field, validator
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, JSON
+import httpx
+import orjson
+from fastapi import FastAPI, Body, Depends, BackgroundTasks, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from sqlalchemy import (
+    event, select, Column, Index, Integer, String, Boolean,
+    DateTime, JSON
+)
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.ext.asyncio import (
+    AsyncSession, async_sessionmaker, create_async_engine
+)
 
-DATABASE_URL = "sqlite:///./test.db"
+DATABASE_URL = os.environ.get(
+    "DATABASE_URL", "sqlite+aiosqlite:///./test.db"
+)
+
+# Upper bound on items accepted by the bulk endpoints
+MAX_BULK_ITEMS = 1000
+
+# Upper bound on the page size accepted by the list endpoints
+MAX_PAGE_SIZE = 1000
+
+# Upper bound on rows returned by one NDJSON stream request
+MAX_STREAM_ROWS = 100_000
+
+# Rows fetched per round trip when streaming list endpoints as NDJSON
+STREAM_BATCH_SIZE = 200
+
+# OpenAPI description of the NDJSON streaming responses
+NDJSON_RESPONSES = {
+    200: {
+        "description": "One JSON object per line.",
+        "content": {"application/x-ndjson": {}},
+    }
+}
 
 # Database engine and session setup
-engine = create_engine(DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_async_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads
+)
+
+
+@event.listens_for(engine.sync_engine, "connect")
+def set_sqlite_pragmas(dbapi_connection, _connection_record):
+    """Enable WAL and tune SQLite for many small write transactions."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.close()
+
+
+SessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
 Base = declarative_base()
 
+logger = logging.getLogger(__name__)
+# Delivery confirmations are logged at INFO. Default this module to INFO so
+# they show up under a WARNING root logger, unless logging config has
+# already set a level for it.
+if logger.level == logging.NOTSET:
+    logger.setLevel(logging.INFO)
+
+# Log records are queued by the caller and written to stderr by a listener
+# thread, so logging in the SMS fan-out never blocks on stream I/O.
+_log_queue = queue.Queue(-1)
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(
+    logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+)
+_log_listener = QueueListener(_log_queue, _log_handler)
+
+# Shared HTTP client so Twilio connections are kept alive across alerts.
+# It is created by the lifespan handler so every app startup gets an open
+# client, even after a previous shutdown closed the last one.
+client: Optional[httpx.AsyncClient] = None
+
+
+def _create_http_client() -> httpx.AsyncClient:
+    """Build the HTTP client used for Twilio requests.
+
+    Idle connections are held for a minute (httpx defaults to 5s) so that
+    alerts arriving close together skip the TCP and TLS handshake.
+    """
+    return httpx.AsyncClient(
+        timeout=10,
+        limits=httpx.Limits(
+            max_connections=50,
+            max_keepalive_connections=20,
+            keepalive_expiry=60
+        )
+    )
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Create database tables on startup and release resources on exit."""
+    global client  # pylint: disable=global-statement
+    client = _create_http_client()
+    root_logger = logging.getLogger()
+    queue_handler = QueueHandler(_log_queue)
+    root_logger.addHandler(queue_handler)
+    _log_listener.start()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield
+    await client.aclose()
+    await engine.dispose()
+    _log_listener.stop()
+    root_logger.removeHandler(queue_handler)
+
+
 # FastAPI app instance
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 
 class SOSAlert(Base):
     """Represents an SOS alert record in the database."""
     __tablename__ = "sos_alerts"
+    __table_args__ = (
+        Index("ix_sos_user_id_desc", "user_id", "id"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer)
     emergency_button_pressed = Column(Boolean)
     emergency_contacts = Column(JSON)
     gps_location = Column(String)
@@ -47,12 +166,15 @@ class SOSAlert(Base):
 class Reminder(Base):
     """Represents a reminder record in the database."""
     __tablename__ = "reminders"
+    __table_args__ = (
+        Index("ix_reminders_user_time", "user_id", "reminder_time"),
+    )
 
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer)
     reminder_type = Column(String)
     reminder_text = Column(String)
-    reminder_time = Column(String)
+    reminder_time = Column(DateTime, index=True)
 
     def __repr__(self):
         return (
@@ -62,27 +184,41 @@ class Reminder(Base):
 
     def postpone_reminder(self, minutes: int):
         """Postpone the reminder time by a given number of minutes."""
-        current_time = datetime.fromisoformat(self.reminder_time)
-        new_time = current_time + timedelta(minutes=minutes)
-        self.reminder_time = new_time.isoformat()
+        self.reminder_time = self.reminder_time + timedelta(minutes=minutes)
+
+
+# Validation patterns and constants, built once at import time. These are
+# deliberately stricter than plain float()/isdigit() parsing: coordinates
+# must be plain decimals (no "+", exponents or bare ".5"), contacts need a
+# non-empty name, and blood pressure values are 1-3 digits without leading
+# zeros.
+_BP_RE = re.compile(r"([1-9]\d{0,2})/([1-9]\d{0,2})")
+_GPS_RE = re.compile(r"\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*")
+_CONTACT_RE = re.compile(r"[^:]+:\d+")
+_ALLOWED_REMINDER_TYPES = frozenset(
+    {"Medication", "Daily Tasks", "Doctor Appointments"}
+)
+_MAX_REMINDER_WORDS = 50
+_MIN_LEAD = timedelta(minutes=1)
 
 
 class VitalInfo(BaseModel):
     """Vital information such as SpO2, blood pressure, and pulse."""
-    spo2: float = Field(..., example=95.5)
-    blood_pressure: str = Field(..., example="120/80")
-    pulse: int = Field(..., example=75)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
+    spo2: float = Field(..., examples=[95.5])
+    blood_pressure: str = Field(..., examples=["120/80"])
+    pulse: int = Field(..., examples=[75])
 
-    @validator("blood_pressure")
-    def validate_blood_pressure(cls, v):  # pylint: disable=no-self-argument
+    @field_validator("blood_pressure", mode="after")
+    @classmethod
+    def validate_blood_pressure(cls, v):
         """Validate blood pressure format."""
-        systolic, diastolic = v.split("/")
-        if not systolic.isdigit() or not diastolic.isdigit():
+        if not _BP_RE.fullmatch(v):
             raise ValueError(
                 "Blood pressure should be in the format 'systolic/diastolic'"
+                " with positive integers"
             )
-        if int(systolic) <= 0 or int(diastolic) <= 0:
-            raise ValueError("Blood pressure should be positive integers")
         return v
 
     def is_normal(self) -> bool:
@@ -92,38 +228,42 @@ class VitalInfo(BaseModel):
 
 class SOSRequest(BaseModel):
     """Request model for creating an SOS alert."""
-    user_id: int = Field(..., example=1)
-    emergency_button_pressed: bool = Field(..., example=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
+    user_id: int = Field(..., examples=[1])
+    emergency_button_pressed: bool = Field(..., examples=[True])
     emergency_contacts: List[str] = Field(
-        ..., example=["John:1234567890", "Jane:9876543210"]
+        ..., examples=[["John:1234567890", "Jane:9876543210"]]
     )
-    gps_location: str = Field(..., example="40.712776, -74.005974")
+    gps_location: str = Field(..., examples=["40.712776, -74.005974"])
     vital_info: VitalInfo
 
-    @validator("gps_location")
-    def validate_gps_location(cls, v):  # pylint: disable=no-self-argument
+    @field_validator("gps_location", mode="after")
+    @classmethod
+    def validate_gps_location(cls, v):
         """Validate GPS coordinates format."""
-        try:
-            lat, lon = map(float, v.split(","))
-            if not -90 <= lat <= 90 or not -180 <= lon <= 180:
-                raise ValueError("Invalid GPS coordinates")
-        except ValueError as exc:
-            raise ValueError("Invalid GPS coordinates format") from exc
+        match = _GPS_RE.fullmatch(v)
+        if not match:
+            raise ValueError("Invalid GPS coordinates format")
+        if not (-90 <= float(match[1]) <= 90
+                and -180 <= float(match[2]) <= 180):
+            raise ValueError("Invalid GPS coordinates")
         return v
 
-    @validator("emergency_contacts")
-    def validate_emergency_contacts(cls, v):  # pylint: disable=no-self-argument
+    @field_validator("emergency_contacts", mode="after")
+    @classmethod
+    def validate_emergency_contacts(cls, v):
         """Validate format of emergency contacts."""
         for contact in v:
-            parts = contact.split(":")
-            if len(parts) != 2 or not parts[1].isdigit():
+            if not _CONTACT_RE.fullmatch(contact):
                 raise ValueError(
                     "Emergency contact format should be 'Name:Phone'"
                 )
         return v
 
-    @validator("user_id")
-    def validate_user_id(cls, v):  # pylint: disable=no-self-argument
+    @field_validator("user_id", mode="after")
+    @classmethod
+    def validate_user_id(cls, v):
         """Ensure user ID is a positive integer."""
         if v <= 0:
             raise ValueError("User ID must be a positive integer")
@@ -132,125 +272,373 @@ class SOSRequest(BaseModel):
 
 class ReminderRequest(BaseModel):
     """Request model for creating a reminder."""
-    user_id: int = Field(..., example=1)
-    reminder_type: str = Field(..., example="Medication")
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
+
+    user_id: int = Field(..., examples=[1])
+    reminder_type: str = Field(..., examples=["Medication"])
     reminder_text: str = Field(
-        ..., example="Take your blood pressure medication"
+        ..., examples=["Take your blood pressure medication"]
     )
-    reminder_time: datetime = Field(..., example="2024-06-10T09:00:00")
+    reminder_time: datetime = Field(..., examples=["2024-06-10T09:00:00"])
 
-    @validator("user_id")
-    def validate_user_id(cls, v):  # pylint: disable=no-self-argument
+    @field_validator("user_id", mode="after")
+    @classmethod
+    def validate_user_id(cls, v):
         """Ensure user ID is a positive integer."""
         if v <= 0:
             raise ValueError("User ID must be a positive integer")
         return v
 
-    @validator("reminder_type")
-    def validate_reminder_type(cls, v):  # pylint: disable=no-self-argument
+    @field_validator("reminder_type", mode="after")
+    @classmethod
+    def validate_reminder_type(cls, v):
         """Validate reminder type."""
-        allowed_types = {"Medication", "Daily Tasks", "Doctor Appointments"}
-        if v not in allowed_types:
+        if v not in _ALLOWED_REMINDER_TYPES:
             raise ValueError("Invalid reminder type")
         return v
 
-    @validator("reminder_text")
-    def validate_reminder_text(cls, v):  # pylint: disable=no-self-argument
+    @field_validator("reminder_text", mode="after")
+    @classmethod
+    def validate_reminder_text(cls, v):
         """Ensure reminder text is within allowed word count."""
-        max_words = 50
-        if len(v.split()) > max_words:
-            raise ValueError(f"Reminder text must be within {max_words} words")
+        if len(v.split()) > _MAX_REMINDER_WORDS:
+            raise ValueError(
+                f"Reminder text must be within {_MAX_REMINDER_WORDS} words"
+            )
         return v
 
-    @validator("reminder_time")
-    def validate_reminder_time(cls, v):  # pylint: disable=no-self-argument
+    @field_validator("reminder_time", mode="after")
+    @classmethod
+    def validate_reminder_time(cls, v):
         """Ensure reminder time is at least 1 minute ahead."""
         now = datetime.now()
         if v <= now:
             raise ValueError("Reminder time must be in the future")
-        if v <= now + timedelta(minutes=1):
+        if v <= now + _MIN_LEAD:
             raise ValueError("Reminder time must be at least 1 minute ahead")
         return v
 
 
-Base.metadata.create_all(bind=engine)
+class SOSResponse(BaseModel):
+    """Summary of a stored SOS alert returned by list endpoints."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    gps_location: str
+
+
+class SOSPage(BaseModel):
+    """A page of SOS alerts with the cursor for the next page."""
+    items: List[SOSResponse]
+    next_after: Optional[int] = None
+
+
+class ReminderResponse(BaseModel):
+    """Summary of a stored reminder returned by list endpoints."""
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    reminder_type: str
+    reminder_text: str
+    reminder_time: datetime
+
+
+class ReminderPage(BaseModel):
+    """A page of reminders with the cursor for the next page."""
+    items: List[ReminderResponse]
+    next_after: Optional[int] = None
+
+
+class SOSDetailResponse(BaseModel):
+    """A stored SOS alert with all of its fields."""
+    id: int
+    user_id: int
+    emergency_button_pressed: bool
+    emergency_contacts: List[str]
+    gps_location: str
+    vital_info: VitalInfo
+
 
+class SOSCreatedResponse(BaseModel):
+    """Response returned after creating an SOS alert."""
+    message: str
+    sos_alert: SOSDetailResponse
 
-def get_db():
+
+class ReminderCreatedResponse(BaseModel):
+    """Response returned after creating a reminder."""
+    message: str
+    reminder: ReminderResponse
+
+
+class BulkCreatedResponse(BaseModel):
+    """Response returned after a bulk insert."""
+    message: str
+    count: int
+
+
+class MessageResponse(BaseModel):
+    """Response carrying a single informational message."""
+    message: str
+
+
+# Core insert statements for the hot write paths; these skip the ORM
+# unit-of-work and refresh round trip on every POST.
+_sos_insert_stmt = SOSAlert.__table__.insert().returning(
+    SOSAlert.__table__.c.id
+)
+_reminder_insert_stmt = Reminder.__table__.insert().returning(
+    Reminder.__table__.c.id
+)
+
+
+async def get_db():
     """Provide a database session."""
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
-def send_sos_alert(sos_alert: SOSAlert):
-    """Send an SOS alert message to emergency contacts.
+class CircuitOpenError(Exception):
+    """Raised when a call is short-circuited by an open circuit breaker."""
+
+
+class CircuitBreaker:
+    """Fail fast on calls to a dependency that keeps failing.
+
+    After ``fail_max`` consecutive failures the breaker opens and rejects
+    calls for ``reset_timeout`` seconds. It then lets a single probe call
+    through (half-open): success closes the breaker, failure re-opens it.
+    Failures of calls that were already in flight when the breaker opened
+    do not restart the cool-down.
+    """
+
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 30):
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def __repr__(self):
+        return (
+            f"<CircuitBreaker(state={self.state}, failures={self.failures})>"
+        )
+
+    async def call(self, func, *args, **kwargs):
+        """Await ``func(*args, **kwargs)`` through the breaker.
+
+        Raises:
+            CircuitOpenError: If the breaker is open or a probe is in flight.
+        """
+        probe = False
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenError("Circuit is open")
+            self.state = "half-open"
+            probe = True
+        elif self.state == "half-open":
+            raise CircuitOpenError("Circuit is half-open, probe in flight")
+        try:
+            result = await func(*args, **kwargs)
+        except Exception:
+            self._record_failure(probe)
+            raise
+        except BaseException:
+            # A cancelled probe has no result; re-open rather than leave the
+            # breaker stuck in half-open with no probe actually in flight.
+            if probe and self.state == "half-open":
+                self._open()
+            raise
+        self.state = "closed"
+        self.failures = 0
+        return result
+
+    def _record_failure(self, probe: bool):
+        """Count a failure and open the breaker if the threshold is hit.
+
+        Only a failure while closed or of the half-open probe opens the
+        breaker; stragglers finishing while it is open or half-open are
+        counted but do not move ``opened_at``.
+        """
+        self.failures += 1
+        if probe and self.state == "half-open":
+            self._open()
+        elif self.state == "closed" and self.failures >= self.fail_max:
+            self._open()
+
+    def _open(self):
+        """Open the breaker and start the reset timeout."""
+        self.state = "open"
+        self.opened_at = time.monotonic()
+
+
+twilio_breaker = CircuitBreaker(fail_max=5, reset_timeout=30)
+
+TWILIO_MESSAGES_URL = (
+    "https://api.twilio.com/2010-04-01/Accounts/your_account_sid/"
+    "Messages.json"
+)
+TWILIO_AUTH = ("your_account_sid", "your_auth_token")
+TWILIO_FROM_NUMBER = "your_twilio_phone_number"
+TWILIO_MAX_ATTEMPTS = 3
+TWILIO_MAX_CONCURRENCY = 16
+TWILIO_BACKOFF_BASE = 0.2
+TWILIO_BACKOFF_MAX = 4.0
+
+
+def _backoff_delay(
+    attempt: int, response: Optional[httpx.Response] = None
+) -> Optional[float]:
+    """Return how long to wait before retrying a Twilio request.
+
+    Honours a numeric ``Retry-After`` header when present, otherwise uses
+    exponential backoff with full jitter capped at ``TWILIO_BACKOFF_MAX``
+    seconds. Returns None when ``Retry-After`` asks for a longer wait than
+    that, meaning the request should not be retried.
+    """
+    if response is not None:
+        retry_after = response.headers.get("Retry-After", "")
+        if retry_after.isdigit():
+            delay = float(retry_after)
+            return delay if delay <= TWILIO_BACKOFF_MAX else None
+    return random.uniform(
+        0, min(TWILIO_BACKOFF_MAX, TWILIO_BACKOFF_BASE * 2 ** attempt)
+    )
+
+
+# Bulkhead: caps concurrent Twilio requests across all alerts
+_twilio_semaphore = asyncio.Semaphore(TWILIO_MAX_CONCURRENCY)
+
+
+async def _post_twilio(data: dict) -> httpx.Response:
+    """POST a single message to Twilio.
+
+    Network errors and 5xx responses raise, so they count against the
+    circuit breaker; 4xx responses are returned to the caller.
+    """
+    response = await client.post(
+        TWILIO_MESSAGES_URL, auth=TWILIO_AUTH, data=data
+    )
+    if response.status_code >= 500:
+        response.raise_for_status()
+    return response
+
+
+async def _send_sms(contact: str, data: dict):
+    """Send a single SOS text message to one emergency contact.
+
+    Network errors, 5xx and 429 responses are retried with backoff up to
+    ``TWILIO_MAX_ATTEMPTS`` times. An open circuit, or a ``Retry-After``
+    longer than ``TWILIO_BACKOFF_MAX``, stops retrying at once. At most
+    ``TWILIO_MAX_CONCURRENCY`` requests are in flight at once, and the
+    breaker is only consulted once a slot is free, so sends queued behind
+    the bulkhead are skipped as soon as the circuit opens.
+
+    Args:
+        contact: The emergency contact in 'Name:Phone' format.
+        data: The Twilio form data for this contact's message.
+    """
+    for attempt in range(TWILIO_MAX_ATTEMPTS):
+        last_attempt = attempt == TWILIO_MAX_ATTEMPTS - 1
+        try:
+            async with _twilio_semaphore:
+                response = await twilio_breaker.call(_post_twilio, data)
+        except CircuitOpenError:
+            logger.warning("Circuit open, skipping message to %s", contact)
+            return
+        except httpx.HTTPError as e:
+            if last_attempt:
+                logger.warning(
+                    "Failed to send message to %s: %s", contact, e
+                )
+                return
+            delay = _backoff_delay(attempt)
+        else:
+            delay = None
+            if response.status_code == 429 and not last_attempt:
+                delay = _backoff_delay(attempt, response)
+            if delay is None:
+                try:
+                    response.raise_for_status()
+                    logger.info("Message sent to %s", contact)
+                except httpx.HTTPStatusError as e:
+                    logger.warning(
+                        "Failed to send message to %s: %s", contact, e
+                    )
+                return
+        await asyncio.sleep(delay)
+
+
+async def send_sos_alert(sos_alert: dict):
+    """Send an SOS alert message to all emergency contacts concurrently.
 
     Args:
-        sos_alert: The SOS alert instance to send.
+        sos_alert: A plain dict snapshot of the SOS alert to send.
     """
+    vital_info = sos_alert["vital_info"]
     message = (
-        f"SOS Alert! User ID: {sos_alert.user_id}\n"
-        f"Location: {sos_alert.gps_location}\n"
+        f"SOS Alert! User ID: {sos_alert['user_id']}\n"
+        f"Location: {sos_alert['gps_location']}\n"
         "Vital Information:\n"
-        f"  - SpO2: {sos_alert.vital_info['spo2']}\n"
-        f"  - Blood Pressure: {sos_alert.vital_info['blood_pressure']}\n"
-        f"  - Pulse: {sos_alert.vital_info['pulse']}\n"
+        f"  - SpO2: {vital_info['spo2']}\n"
+        f"  - Blood Pressure: {vital_info['blood_pressure']}\n"
+        f"  - Pulse: {vital_info['pulse']}\n"
     )
-    for contact in sos_alert.emergency_contacts:
-        try:
-            response = requests.post(
-                "https://api.twilio.com/2010-04-01/Accounts/your_account_sid/"
-                "Messages.json",
-                auth=("your_account_sid", "your_auth_token"),
-                data={
-                    "From": "your_twilio_phone_number",
-                    "To": contact.split(":")[1],
-                    "Body": message
-                },
-                timeout=10  # Added timeout to prevent indefinite hangs
+    base_data = {"From": TWILIO_FROM_NUMBER, "Body": message}
+    contacts = sos_alert["emergency_contacts"]
+    results = await asyncio.gather(
+        *(_send_sms(contact, {**base_data, "To": contact.split(":", 1)[1]})
+          for contact in contacts),
+        return_exceptions=True
+    )
+    for contact, result in zip(contacts, results):
+        if isinstance(result, BaseException):
+            logger.exception(
+                "Unexpected error sending message to %s", contact,
+                exc_info=result
             )
-            response.raise_for_status()
-            print(f"Message sent to {contact}")
-        except requests.RequestException as e:
-            print(f"Failed to send message to {contact}: {e}")
 
 
-@app.post("/sos/")
+@app.post("/sos/", response_model=SOSCreatedResponse)
 async def create_sos_alert(
     sos: SOSRequest,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Create a new SOS alert and send notifications.
+    Create a new SOS alert and schedule notifications.
+
+    Notifications are sent in a background task once the response has
+    been returned, so the request is not blocked on Twilio.
 
     Args:
         sos: The SOS request data.
+        background_tasks: FastAPI background task queue.
         db: The database session dependency.
 
     Returns:
         A dictionary with the result message and created SOS alert.
     """
-    sos_alert = SOSAlert(
-        user_id=sos.user_id,
-        emergency_button_pressed=sos.emergency_button_pressed,
-        emergency_contacts=sos.emergency_contacts,
-        gps_location=sos.gps_location,
-        vital_info=sos.vital_info.dict()
-    )
-    db.add(sos_alert)
-    db.commit()
-    db.refresh(sos_alert)
-    send_sos_alert(sos_alert)
+    sos_alert = {
+        "user_id": sos.user_id,
+        "emergency_button_pressed": sos.emergency_button_pressed,
+        "emergency_contacts": sos.emergency_contacts,
+        "gps_location": sos.gps_location,
+        "vital_info": sos.vital_info.model_dump()
+    }
+    result = await db.execute(_sos_insert_stmt, sos_alert)
+    sos_alert["id"] = result.scalar()
+    await db.commit()
+    background_tasks.add_task(send_sos_alert, sos_alert)
     return {"message": "SOS alert created", "sos_alert": sos_alert}
 
 
-@app.post("/reminders/")
+@app.post("/reminders/", response_model=ReminderCreatedResponse)
 async def create_reminder(
     reminder: ReminderRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Create a new reminder.
@@ -262,19 +650,87 @@ async def create_reminder(
     Returns:
         A dictionary with the result message and created reminder.
     """
-    reminder_instance = Reminder(
-        user_id=reminder.user_id,
-        reminder_type=reminder.reminder_type,
-        reminder_text=reminder.reminder_text,
-        reminder_time=reminder.reminder_time.isoformat()
-    )
-    db.add(reminder_instance)
-    db.commit()
-    db.refresh(reminder_instance)
+    reminder_instance = {
+        "user_id": reminder.user_id,
+        "reminder_type": reminder.reminder_type,
+        "reminder_text": reminder.reminder_text,
+        "reminder_time": reminder.reminder_time
+    }
+    result = await db.execute(_reminder_insert_stmt, reminder_instance)
+    reminder_instance["id"] = result.scalar()
+    await db.commit()
     return {"message": "Reminder created", "reminder": reminder_instance}
 
 
-@app.get("/")
+@app.post("/sos/bulk/", response_model=BulkCreatedResponse)
+async def create_sos_alerts_bulk(
+    items: List[SOSRequest] = Body(..., max_length=MAX_BULK_ITEMS),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many SOS alerts in a single transaction.
+
+    Intended for clients that sync records in batches, so no notifications
+    are sent. Batches of 500-1000 items are recommended and at most
+    ``MAX_BULK_ITEMS`` are accepted.
+
+    Args:
+        items: The SOS request data to store.
+        db: The database session dependency.
+
+    Returns:
+        A dictionary with the result message and number of alerts created.
+    """
+    rows = [
+        {
+            "user_id": sos.user_id,
+            "emergency_button_pressed": sos.emergency_button_pressed,
+            "emergency_contacts": sos.emergency_contacts,
+            "gps_location": sos.gps_location,
+            "vital_info": sos.vital_info.model_dump()
+        }
+        for sos in items
+    ]
+    if rows:
+        async with db.begin():
+            await db.execute(SOSAlert.__table__.insert(), rows)
+    return {"message": "SOS alerts created", "count": len(rows)}
+
+
+@app.post("/reminders/bulk/", response_model=BulkCreatedResponse)
+async def create_reminders_bulk(
+    items: List[ReminderRequest] = Body(..., max_length=MAX_BULK_ITEMS),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Create many reminders in a single transaction.
+
+    Batches of 500-1000 items are recommended and at most
+    ``MAX_BULK_ITEMS`` are accepted.
+
+    Args:
+        items: The reminder request data to store.
+        db: The database session dependency.
+
+    Returns:
+        A dictionary with the result message and number of reminders created.
+    """
+    rows = [
+        {
+            "user_id": reminder.user_id,
+            "reminder_type": reminder.reminder_type,
+            "reminder_text": reminder.reminder_text,
+            "reminder_time": reminder.reminder_time
+        }
+        for reminder in items
+    ]
+    if rows:
+        async with db.begin():
+            await db.execute(Reminder.__table__.insert(), rows)
+    return {"message": "Reminders created", "count": len(rows)}
+
+
+@app.get("/", response_model=MessageResponse)
 async def read_root():
     """
     Root endpoint to check if the API is running.
@@ -285,7 +741,7 @@ async def read_root():
     return {"message": "Person Engagement App API is running"}
 
 
-@app.get("/hello/{name}")
+@app.get("/hello/{name}", response_model=MessageResponse)
 async def say_hello(name: str):
     """
     Greet a user by name.
@@ -299,43 +755,165 @@ async def say_hello(name: str):
     return {"message": f"Hello, {name}"}
 
 
-@app.get("/sos/", response_model=List[SOSRequest])
+def _sos_list_stmt(after: Optional[int], limit: int):
+    """Select a keyset page of SOS alert summaries."""
+    return (
+        select(SOSAlert.id, SOSAlert.user_id, SOSAlert.gps_location)
+        .where(SOSAlert.id > (after or 0))
+        .order_by(SOSAlert.id)
+        .limit(limit)
+    )
+
+
+def _reminder_list_stmt(after: Optional[int], limit: int):
+    """Select a keyset page of reminders."""
+    return (
+        select(
+            Reminder.id,
+            Reminder.user_id,
+            Reminder.reminder_type,
+            Reminder.reminder_text,
+            Reminder.reminder_time
+        )
+        .where(Reminder.id > (after or 0))
+        .order_by(Reminder.id)
+        .limit(limit)
+    )
+
+
+async def _stream_ndjson(stmt, model):
+    """Yield the rows selected by ``stmt`` as NDJSON lines.
+
+    Uses its own session so it stays open for as long as the response is
+    streaming, and fetches rows in batches of ``STREAM_BATCH_SIZE``.
+
+    Args:
+        stmt: The select statement to run.
+        model: The response model used to serialize each row.
+    """
+    async with SessionLocal() as db:
+        result = await db.stream(
+            stmt.execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
+        async for row in result:
+            yield model.model_validate(
+                row, from_attributes=True
+            ).model_dump_json() + "\n"
+
+
+@app.get("/sos/", response_model=SOSPage)
 async def read_sos_alerts(
-    skip: int = 0,
-    limit: int = 10,
-    db: Session = Depends(get_db)
+    after: Optional[int] = Query(None, ge=0),
+    limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve SOS alerts from the database.
 
+    Uses keyset pagination on the primary key, so each page is an index
+    seek rather than an OFFSET scan. The page is serialized directly by
+    pydantic-core; ``response_model`` is only used for the OpenAPI schema.
+
     Args:
-        skip: The number of records to skip (pagination).
-        limit: The maximum number of records to return.
+        after: Only return alerts with an ID greater than this cursor.
+        limit: The maximum number of records to return, up to
+            ``MAX_PAGE_SIZE``. Use the stream route for larger reads.
         db: The database session dependency.
 
     Returns:
-        A list of SOS alert records.
+        A page of SOS alert summaries and the cursor for the next page.
     """
-    alerts = db.query(SOSAlert).offset(skip).limit(limit).all()
-    return alerts
+    alerts = (await db.execute(_sos_list_stmt(after, limit))).all()
+    next_after = alerts[-1].id if len(alerts) == limit else None
+    page = SOSPage.model_validate(
+        {"items": alerts, "next_after": next_after}, from_attributes=True
+    )
+    return Response(page.model_dump_json(), media_type="application/json")
 
 
-@app.get("/reminders/", response_model=List[ReminderRequest])
+@app.get(
+    "/sos/stream/",
+    response_class=StreamingResponse,
+    responses=NDJSON_RESPONSES
+)
+async def stream_sos_alerts(
+    after: Optional[int] = Query(None, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_STREAM_ROWS)
+):
+    """
+    Stream SOS alert summaries as NDJSON, one alert per line.
+
+    Memory use stays flat regardless of ``limit``. Use the last ID
+    received as the ``after`` cursor for the next request.
+
+    Args:
+        after: Only return alerts with an ID greater than this cursor.
+        limit: The maximum number of records to return, up to
+            ``MAX_STREAM_ROWS``.
+
+    Returns:
+        A streaming NDJSON response of SOS alert summaries.
+    """
+    return StreamingResponse(
+        _stream_ndjson(_sos_list_stmt(after, limit), SOSResponse),
+        media_type="application/x-ndjson"
+    )
+
+
+@app.get("/reminders/", response_model=ReminderPage)
 async def read_reminders(
-    skip: int = 0,
-    limit: int = 10,
-    db: Session = Depends(get_db)
+    after: Optional[int] = Query(None, ge=0),
+    limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Retrieve reminders from the database.
 
+    Uses keyset pagination on the primary key, so each page is an index
+    seek rather than an OFFSET scan. The page is serialized directly by
+    pydantic-core; ``response_model`` is only used for the OpenAPI schema.
+
     Args:
-        skip: The number of records to skip (pagination).
-        limit: The maximum number of records to return.
+        after: Only return reminders with an ID greater than this cursor.
+        limit: The maximum number of records to return, up to
+            ``MAX_PAGE_SIZE``. Use the stream route for larger reads.
         db: The database session dependency.
 
     Returns:
-        A list of reminder records.
+        A page of reminders and the cursor for the next page.
+    """
+    reminders = (await db.execute(_reminder_list_stmt(after, limit))).all()
+    next_after = reminders[-1].id if len(reminders) == limit else None
+    page = ReminderPage.model_validate(
+        {"items": reminders, "next_after": next_after}, from_attributes=True
+    )
+    return Response(page.model_dump_json(), media_type="application/json")
+
+
+@app.get(
+    "/reminders/stream/",
+    response_class=StreamingResponse,
+    responses=NDJSON_RESPONSES
+)
+async def stream_reminders(
+    after: Optional[int] = Query(None, ge=0),
+    limit: int = Query(MAX_PAGE_SIZE, ge=1, le=MAX_STREAM_ROWS)
+):
+    """
+    Stream reminders as NDJSON, one reminder per line.
+
+    Memory use stays flat regardless of ``limit``. Use the last ID
+    received as the ``after`` cursor for the next request.
+
+    Args:
+        after: Only return reminders with an ID greater than this cursor.
+        limit: The maximum number of records to return, up to
+            ``MAX_STREAM_ROWS``.
+
+    Returns:
+        A streaming NDJSON response of reminders.
     """
-    reminders = db.query(Reminder).offset(skip).limit(limit).all()
-    return reminders
+    return StreamingResponse(
+        _stream_ndjson(_reminder_list_stmt(after, limit), ReminderResponse),
+        media_type="application/x-ndjson"
+    )
@@ -0,0 +1,360 @@
+"""
+Tests for the main module.
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+
+import main
+
+from main import (
+    MAX_BULK_ITEMS, MAX_PAGE_SIZE, MAX_STREAM_ROWS, CircuitBreaker,
+    CircuitOpenError, app
+)
+
+SOS_PAYLOAD = {
+    "user_id": 1,
+    "emergency_button_pressed": True,
+    "emergency_contacts": ["John:1234567890"],
+    "gps_location": "40.712776, -74.005974",
+    "vital_info": {"spo2": 95.5, "blood_pressure": "120/80", "pulse": 75},
+}
+
+
+def _reminder_payload():
+    return {
+        "user_id": 1,
+        "reminder_type": "Medication",
+        "reminder_text": "Take your blood pressure medication",
+        "reminder_time": (datetime.now() + timedelta(hours=1)).isoformat(),
+    }
+
+
+@pytest.fixture
+def api():
+    """A TestClient with the lifespan running against an empty database."""
+    path = main.engine.url.database
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(path + suffix):
+            os.remove(path + suffix)
+    with TestClient(app) as client:
+        yield client
+
+
+async def _fail():
+    raise RuntimeError("boom")
+
+
+async def _succeed():
+    return "ok"
+
+
+async def _open_breaker(breaker):
+    """Trip the breaker by failing ``fail_max`` times."""
+    for _ in range(breaker.fail_max):
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+
+
+def test_opens_after_fail_max_failures():
+    async def scenario():
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=60)
+        await _open_breaker(breaker)
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            await breaker.call(_succeed)
+
+    asyncio.run(scenario())
+
+
+def test_successful_probe_closes_breaker():
+    async def scenario():
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=0)
+        await _open_breaker(breaker)
+        assert await breaker.call(_succeed) == "ok"
+        assert breaker.state == "closed"
+        assert breaker.failures == 0
+
+    asyncio.run(scenario())
+
+
+def test_failed_probe_reopens_breaker():
+    async def scenario():
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=0)
+        await _open_breaker(breaker)
+        with pytest.raises(RuntimeError):
+            await breaker.call(_fail)
+        assert breaker.state == "open"
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_probe_does_not_stick_half_open():
+    async def scenario():
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=0)
+        await _open_breaker(breaker)
+        probe = asyncio.create_task(breaker.call(asyncio.sleep, 60))
+        await asyncio.sleep(0)
+        assert breaker.state == "half-open"
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        assert breaker.state == "open"
+        assert await breaker.call(_succeed) == "ok"
+        assert breaker.state == "closed"
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.parametrize("path", ["/sos/", "/reminders/"])
+@pytest.mark.parametrize(
+    "query", ["limit=0", "limit=-1", f"limit={MAX_PAGE_SIZE + 1}", "after=-1"]
+)
+def test_list_endpoints_reject_invalid_pagination(path, query):
+    client = TestClient(app)
+    assert client.get(f"{path}?{query}").status_code == 422
+
+
+def _mock_twilio(monkeypatch, responses):
+    """Route Twilio POSTs to ``responses`` in order and record each call."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return responses[len(calls) - 1]
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        main, "client", httpx.AsyncClient(transport=transport)
+    )
+    monkeypatch.setattr(main, "twilio_breaker", CircuitBreaker())
+    return calls
+
+
+def test_short_retry_after_is_retried(monkeypatch):
+    calls = _mock_twilio(monkeypatch, [
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(201),
+    ])
+    asyncio.run(main._send_sms("John:1234567890", {"To": "1234567890"}))
+    assert len(calls) == 2
+
+
+def test_long_retry_after_is_not_retried(monkeypatch, caplog):
+    calls = _mock_twilio(monkeypatch, [
+        httpx.Response(429, headers={"Retry-After": "60"}),
+        httpx.Response(201),
+    ])
+    asyncio.run(main._send_sms("John:1234567890", {"To": "1234567890"}))
+    assert len(calls) == 1
+    assert "Failed to send message to John:1234567890" in caplog.text
+
+
+def test_unexpected_send_error_is_logged(monkeypatch, caplog):
+    async def broken_send(contact, data):
+        raise KeyError("boom")
+
+    monkeypatch.setattr(main, "_send_sms", broken_send)
+    asyncio.run(main.send_sos_alert({
+        "user_id": 1,
+        "emergency_contacts": ["John:1234567890"],
+        "gps_location": "40.712776, -74.005974",
+        "vital_info": {"spo2": 95.5, "blood_pressure": "120/80", "pulse": 75},
+    }))
+    assert "Unexpected error sending message to John:1234567890" in caplog.text
+    assert "KeyError" in caplog.text
+
+
+def test_in_flight_failures_do_not_restart_cooldown():
+    async def scenario():
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=60)
+        release = asyncio.Event()
+
+        async def fail_later():
+            await release.wait()
+            raise RuntimeError("boom")
+
+        stragglers = [
+            asyncio.create_task(breaker.call(fail_later)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        await _open_breaker(breaker)
+        opened_at = breaker.opened_at
+        release.set()
+        await asyncio.gather(*stragglers, return_exceptions=True)
+        assert breaker.state == "open"
+        assert breaker.opened_at == opened_at
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_non_probe_call_does_not_reopen():
+    async def scenario():
+        breaker = CircuitBreaker(fail_max=1, reset_timeout=0)
+        straggler = asyncio.create_task(breaker.call(asyncio.sleep, 60))
+        await asyncio.sleep(0)
+        await _open_breaker(breaker)
+        probe = asyncio.create_task(breaker.call(asyncio.sleep, 60))
+        await asyncio.sleep(0)
+        assert breaker.state == "half-open"
+        straggler.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await straggler
+        assert breaker.state == "half-open"
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+        assert breaker.state == "open"
+
+    asyncio.run(scenario())
+
+
+def test_open_circuit_stops_sends_queued_behind_bulkhead(monkeypatch):
+    calls = []
+
+    async def handler(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        raise httpx.ConnectTimeout("timed out", request=request)
+
+    transport = httpx.MockTransport(handler)
+    monkeypatch.setattr(
+        main, "client", httpx.AsyncClient(transport=transport)
+    )
+    monkeypatch.setattr(
+        main, "twilio_breaker", CircuitBreaker(fail_max=5, reset_timeout=60)
+    )
+    asyncio.run(main.send_sos_alert({
+        "user_id": 1,
+        "emergency_contacts": [f"Contact{i}:{i}" for i in range(200)],
+        "gps_location": "40.712776, -74.005974",
+        "vital_info": {"spo2": 95.5, "blood_pressure": "120/80", "pulse": 75},
+    }))
+    assert main.twilio_breaker.state == "open"
+    # At most one bulkhead's worth of requests beyond the ones that tripped
+    # the breaker can already be in flight when it opens.
+    assert len(calls) < 5 + main.TWILIO_MAX_CONCURRENCY
+
+
+def test_bulk_insert_sos_alerts(api):
+    response = api.post("/sos/bulk/", json=[SOS_PAYLOAD] * 3)
+    assert response.status_code == 200
+    assert response.json()["count"] == 3
+    assert len(api.get("/sos/").json()["items"]) == 3
+
+
+def test_bulk_insert_empty_list(api):
+    response = api.post("/reminders/bulk/", json=[])
+    assert response.status_code == 200
+    assert response.json()["count"] == 0
+    assert api.get("/reminders/").json()["items"] == []
+
+
+def test_bulk_insert_rejects_oversized_batch(api):
+    oversized = [SOS_PAYLOAD] * (MAX_BULK_ITEMS + 1)
+    response = api.post("/sos/bulk/", json=oversized)
+    assert response.status_code == 422
+    assert api.get("/sos/").json()["items"] == []
+
+
+def test_keyset_pagination_round_trip(api):
+    api.post("/reminders/bulk/", json=[_reminder_payload() for _ in range(5)])
+    seen = []
+    after = None
+    while True:
+        params = {"limit": 2}
+        if after is not None:
+            params["after"] = after
+        page = api.get("/reminders/", params=params).json()
+        seen.extend(item["id"] for item in page["items"])
+        after = page["next_after"]
+        if after is None:
+            break
+    assert seen == [1, 2, 3, 4, 5]
+
+
+def test_http_client_survives_repeated_lifespans():
+    for _ in range(2):
+        with TestClient(app):
+            assert not main.client.is_closed
+
+
+def test_stream_returns_ndjson_rows(api):
+    api.post("/sos/bulk/", json=[SOS_PAYLOAD] * 3)
+    response = api.get("/sos/stream/", params={"after": 1})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [2, 3]
+    assert rows[0]["gps_location"] == SOS_PAYLOAD["gps_location"]
+
+
+@pytest.mark.parametrize("path", ["/sos/stream/", "/reminders/stream/"])
+def test_stream_routes_document_ndjson(path):
+    spec = TestClient(app).get("/openapi.json").json()
+    content = spec["paths"][path]["get"]["responses"]["200"]["content"]
+    assert list(content) == ["application/x-ndjson"]
+
+
+@pytest.mark.parametrize("path", ["/sos/stream/", "/reminders/stream/"])
+def test_stream_limit_is_not_capped_at_page_size(api, path):
+    response = api.get(path, params={"limit": MAX_PAGE_SIZE * 5})
+    assert response.status_code == 200
+    over_cap = {"limit": MAX_STREAM_ROWS + 1}
+    assert api.get(path, params=over_cap).status_code == 422
+
+
+def _sos_with(**overrides):
+    payload = dict(SOS_PAYLOAD, **overrides)
+    if "blood_pressure" in overrides:
+        payload["vital_info"] = dict(
+            SOS_PAYLOAD["vital_info"],
+            blood_pressure=payload.pop("blood_pressure")
+        )
+    return payload
+
+
+@pytest.mark.parametrize("overrides", [
+    {"gps_location": "40.712776, -74.005974"},
+    {"gps_location": "-90,-180"},
+    {"gps_location": " 90 , 180 "},
+    {"emergency_contacts": ["John:1234567890", "Jane:9876543210"]},
+    {"blood_pressure": "120/80"},
+    {"blood_pressure": "999/1"},
+])
+def test_sos_request_accepts(overrides):
+    main.SOSRequest(**_sos_with(**overrides))
+
+
+@pytest.mark.parametrize("overrides", [
+    {"gps_location": "91, 0"},
+    {"gps_location": "0, 181"},
+    {"gps_location": ".5, .5"},
+    {"gps_location": "+40.7, -74"},
+    {"gps_location": "4e1, 7"},
+    {"gps_location": "40.7"},
+    {"emergency_contacts": [":123"]},
+    {"emergency_contacts": ["John:12a"]},
+    {"emergency_contacts": ["John:1:2"]},
+    {"blood_pressure": "0/80"},
+    {"blood_pressure": "0120/80"},
+    {"blood_pressure": "1200/80"},
+    {"blood_pressure": "120-80"},
+    {"user_id": 0},
+])
+def test_sos_request_rejects(overrides):
+    with pytest.raises(ValidationError):
+        main.SOSRequest(**_sos_with(**overrides))
+
+
+def test_delivery_confirmation_logged_by_default(monkeypatch, caplog):
+    _mock_twilio(monkeypatch, [httpx.Response(201)])
+    asyncio.run(main._send_sms("John:1234567890", {"To": "1234567890"}))
+    assert "Message sent to John:1234567890" in caplog.text